@@ -0,0 +1,66 @@
+"""
+Regression tests for TidyDocMD.
+
+Run with: python -m pytest -q
+"""
+
+from nameparser import HumanName
+
+from tidydocmd import _last_key, calculate_reshuffle_percentage
+
+
+def test_reshuffle_report_with_duplicate_names():
+    """
+    Repeated names are matched to their own old positions, so each copy
+    gets the right neighbours and its own line in the report.
+    """
+    before = ["Zed Young", "Ann Lee", "Zed Young"]
+    after = ["Ann Lee", "Zed Young", "Zed Young"]
+    assert calculate_reshuffle_percentage("Python", "Speakers", before, after) == [
+        "Speakers:Python: alphabetized 1 of 3 names (33%):",
+        "* Ann Lee (was after Zed Young, now first)",
+    ]
+
+    before = ["A X", "B Z", "A X", "C Y", "A X"]
+    after = ["A X", "A X", "A X", "C Y", "B Z"]
+    assert calculate_reshuffle_percentage("Python", "Speakers", before, after) == [
+        "Speakers:Python: alphabetized 2 of 5 names (40%):",
+        "* A X (was after C Y, now after A X)",
+        "* B Z (was after A X, now after C Y)",
+    ]
+
+
+def test_last_key_matches_humanname():
+    """
+    The plain-name fast path gives the same sort key as `HumanName` for
+    names holding titles, suffixes, particles, conjunctions, maiden markers,
+    roman numerals and initials.
+    """
+    names = [
+        "Jane Q. Public",
+        "Cher",
+        "Dr. Bob Marley Jr.",
+        "Sir Patrick Stewart",
+        "John Smith III",
+        "Martin Luther King Jr",
+        "Jane Doe PhD",
+        "Vincent van Gogh",
+        "Ludwig von Mises",
+        "Leonardo Di Caprio",
+        "Abdul Salam Khan",
+        "Mary Smith nee Jones",
+        "Mary Smith Nee Jones",
+        "Anna Schmidt geb Weber",
+        "Anna Schmidt geb. Weber",
+        "Maria Kowalska z domu Nowak",
+        "Ivan Petrovich Sidorov",
+        "Jack Ma",
+        "J. R. R. Tolkien",
+        "Smith and Jones",
+        "Mr Smith",
+    ]
+    _last_key.cache_clear()
+    for name in names:
+        parsed_name = HumanName(name)
+        expected = (parsed_name.last or parsed_name.first).lower()
+        assert _last_key(name) == expected, name
@@ -23,14 +23,16 @@ that calculates the percentage of reshuffled names in a section and prints the
 details of each reshuffled name.
 
 The `parse_file` function parses an input file in markdown-like format and
-generates a tree of nested `Section` objects.
+generates a tree of nested `Section` objects. The `tidy_file` function runs
+the whole parse, sort and write pipeline for one file.
 
-Usage: python tidydocmd.py -i input.md -o output.md \
-    [--sections SECTION1 SECTION2 ...] [--debug]
+Usage: python tidydocmd.py -i input.md [input2.md ...] \
+    -o output.md [output2.md ...] [--sections SECTION1 SECTION2 ...] [--debug]
 
 Arguments:
-- -i input.md: Path to the input markdown file.
-- -o output.md: Path to the output markdown file.
+- -i input.md: Path to the input markdown file. Several paths may be given
+to process files in parallel.
+- -o output.md: Path to the output markdown file, one per input path.
 - --sections: Optional. Specify the sections to sort. Default sections are
 `Speakers`, `Organizers`, `Mentors`, and `Getting Started`.
 - --debug: Optional. Enable debug mode for additional output.
@@ -41,15 +43,110 @@ Example: python tidydocmd.py -i input.md -o output.md \
 """
 
 import argparse
+import io
 import logging
-import difflib
+import re
+import sys
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from functools import lru_cache
+from itertools import repeat
 from nameparser import HumanName
 # from datetime import datetime
 
+# The plain-name fast path reads nameparser 2.x's vocabulary. On nameparser
+# 1.x it is disabled and every name goes through `HumanName`.
+try:
+    from nameparser import Lexicon
+    from nameparser.config import CONSTANTS, SetManager
+
+    # Words that make `HumanName` do more than take the last word as last
+    # name
+    _ROMAN_NUMERAL_RE = CONSTANTS.regexes.roman_numeral
+    _PATRONYMIC_RE = CONSTANTS.regexes.east_slavic_patronymic
+except (ImportError, AttributeError):
+    Lexicon = None
+
 # Configuring logging settings
 logging.basicConfig(format="%(asctime)s %(message)s", level=logging.INFO)
 log = logging.getLogger(__name__)  # Create a logger object
 
+# Matches a header line: the leading `#` run, then the name once the single
+# character after the run and any surrounding whitespace are dropped
+_HEADER_RE = re.compile(r"^(#+).?[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE)
+
+# Matches names made only of plain words: ASCII letters and hyphens, each
+# word optionally ending in a period. Anything else (commas, quotes,
+# parentheses, digits, non-ASCII text) may carry structure only `HumanName`
+# understands.
+_PLAIN_NAME_RE = re.compile(
+    r"[A-Za-z][A-Za-z\-]*\.?(?:[ \t]+[A-Za-z][A-Za-z\-]*\.?)*"
+)
+
+
+def _lexicon_words():
+    """
+    Collect every word nameparser gives a special role: titles, suffixes,
+    particles, conjunctions, maiden markers and the rest. Multi-word entries
+    such as "z domu" contribute each of their words.
+
+    :return: frozenset of lower-case words without edge periods
+    """
+    lexicon = Lexicon.default()
+    vocabularies = [getattr(lexicon, field.name) for field in fields(lexicon)]
+    # Entries added through the v1 `CONSTANTS` interface at import time
+    vocabularies += [
+        value for value in vars(CONSTANTS).values() if isinstance(value, SetManager)
+    ]
+    words = set()
+    for vocabulary in vocabularies:
+        if isinstance(vocabulary, (frozenset, SetManager)):
+            for entry in vocabulary:
+                words.update(entry.split())
+    return frozenset(words)
+
+
+_LEXICON_WORDS = _lexicon_words() if Lexicon is not None else None
+
+
+def _is_plain_name(words):
+    """
+    Check whether the last word of a name is its last name, without running
+    the full `HumanName` parser.
+
+    :param words: the name split into words
+    :return: True if no word is in nameparser's vocabulary, a roman numeral
+        or a patronymic
+    """
+    for word in words:
+        if _ROMAN_NUMERAL_RE.match(word) or _PATRONYMIC_RE.search(word):
+            return False
+        if word.lower().strip(".") in _LEXICON_WORDS:
+            return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def _last_key(name):
+    """
+    Parse a section name with `HumanName` and return its sort key. Results
+    are cached, so each distinct name is parsed only once per run. With
+    nameparser 2.x, plain names skip the parser and use their last word
+    directly.
+
+    :param name: the section name
+    :return: lower-case last name or first name
+    """
+    if _LEXICON_WORDS is not None and _PLAIN_NAME_RE.fullmatch(name):
+        words = name.split()
+        # A lone word ending in a period reads as an abbreviation
+        if (len(words) > 1 or not name.endswith(".")) and _is_plain_name(words):
+            return words[-1].lower()
+    parsed_name = HumanName(name)
+    return (parsed_name.last or parsed_name.first).lower()
+
 
 class Section:
     """
@@ -59,6 +156,9 @@ class Section:
     of a document, with facilities to manage nested sections.
     """
 
+    # One instance per header, so skip the per-instance __dict__
+    __slots__ = ("name", "depth", "text", "subsections")
+
     def __init__(self, name, depth):
         """
         Construct a new 'Section' object.
@@ -68,7 +168,7 @@ class Section:
         """
         self.name = name
         self.depth = depth  # Nested section depth
-        self.text = []  # Placeholder for section text
+        self.text = ""  # Placeholder for section text
         self.subsections = []  # Placeholder for nested sections
 
     def __repr__(self):
@@ -85,30 +185,36 @@ class Section:
         :param depth: current section depth
         :return: string representation of the section
         """
-        indent = " " * (depth * 2)
-        result = f"Section(name: {self.name}, depth: {self.depth})\n"
-        if self.text:
-            result += f"{indent}Text: {self.text}\n"
-        if self.subsections:
-            result += f"{indent}Subsections:\n"
-            result += "".join(
-                [subsection._repr(depth + 1) for subsection in self.subsections]
+        parts = []
+        # Walk the tree with an explicit stack to avoid deep recursion
+        stack = [(self, depth)]
+        while stack:
+            section, level = stack.pop()
+            indent = " " * (level * 2)
+            parts.append(
+                f"Section(name: {section.name}, depth: {section.depth})\n"
             )
-        return result
+            if section.text:
+                parts.append(f"{indent}Text: {section.text}\n")
+            if section.subsections:
+                parts.append(f"{indent}Subsections:\n")
+                stack.extend(
+                    (subsection, level + 1)
+                    for subsection in reversed(section.subsections)
+                )
+        return "".join(parts)
 
     def extract_last_name(self, sect):
         """
-        Extract last name from the section name using the `HumanName` parser.
-        If no last name found, use the first name.
+        Extract the sort key (last name, or first name if there is none)
+        from a section name. Kept for compatibility; sorting calls the
+        cached module-level `_last_key` directly, which only runs the
+        `HumanName` parser for names that are not plain words.
 
-        :param section: a `Section` object
+        :param sect: a `Section` object
         :return: lower-case last name or first name
         """
-        parsed_name = HumanName(sect.name)
-        # Split the line into multiple lines
-        return (
-            parsed_name.last.lower() if parsed_name.last else parsed_name.first.lower()
-        )
+        return _last_key(sect.name)
 
     # The grandparent_section_name is passed as the parent_section_name for
     # H3 sections. Attempts to refactor this have not been successful thus
@@ -146,48 +252,75 @@ class Section:
                         self.name,
                         parent_section_name,
                     )
+                # Sort the h4 subsections based on the last name in
+                # section names, unless they are already in order, which is
+                # the common case for a maintained list.
+                keys = [_last_key(sub.name) for sub in self.subsections]
+                already_sorted = all(a <= b for a, b in zip(keys, keys[1:]))
+
+                # The name lists are only needed for the debug output and
+                # for the reshuffle report of a section that gets reordered,
+                # so an already-sorted section skips them outside debug mode
+                debug = log.isEnabledFor(logging.DEBUG)
+                need_names = debug or (
+                    not already_sorted and log.isEnabledFor(logging.INFO)
+                )
                 # First, collect the order of h4 subsections before sorting
-                section_names_before = [sub.name for sub in self.subsections]
+                if need_names:
+                    section_names_before = [sub.name for sub in self.subsections]
+
+                if not already_sorted:
+                    # Sort positions by their precomputed key. The sort is
+                    # stable, so equal keys keep their input order without a
+                    # tie-breaking index, and comparing plain strings lets
+                    # Timsort take full advantage of already-ordered runs.
+                    subsections = self.subsections
+                    order = sorted(range(len(keys)), key=keys.__getitem__)
+                    self.subsections = [subsections[i] for i in order]
+
+                if need_names:
+                    if already_sorted:
+                        section_names_after = section_names_before
+                    else:
+                        section_names_after = [sub.name for sub in self.subsections]
 
-                # Sort the h4 subsections based on the last name in
-                # section names
-                self.subsections.sort(key=self.extract_last_name)
-                section_names_after = [sub.name for sub in self.subsections]
                 # Print the order of the h4 subsections pre- and post-sorting
                 # SOON: implement a less sprawling way of producing this output
-                log.debug(
-                    "Before sorting H4 subsections in H3 section '%s', Parent: '%s', Grandparent: '%s': %s",
-                    self.name,
-                    parent_section_name,
-                    gp_name,
-                    section_names_before,
-                )
-                log.debug(
-                    "After sorting H4 subsections in H3 section '%s', Parent: '%s', Grandparent: '%s': %s",
-                    self.name,
-                    parent_section_name,
-                    gp_name,
-                    section_names_after,
-                )
-                if section_names_before != section_names_after:
-                    # If the order of subsections has changed, calculate
-                    # the percentage of reshuffled names and print the
-                    # details of each reshuffled name.
-                    output_lines = calculate_reshuffle_percentage(
+                if debug:
+                    log.debug(
+                        "Before sorting H4 subsections in H3 section '%s', Parent: '%s', Grandparent: '%s': %s",
                         self.name,
                         parent_section_name,
+                        gp_name,
                         section_names_before,
+                    )
+                    log.debug(
+                        "After sorting H4 subsections in H3 section '%s', Parent: '%s', Grandparent: '%s': %s",
+                        self.name,
+                        parent_section_name,
+                        gp_name,
                         section_names_after,
                     )
-                    for line in output_lines:
-                        log.info(line)  # Print the reshuffle details
+                if not already_sorted:
+                    if need_names:
+                        # If the order of subsections has changed, calculate
+                        # the percentage of reshuffled names and print the
+                        # details of each reshuffled name.
+                        output_lines = calculate_reshuffle_percentage(
+                            self.name,
+                            parent_section_name,
+                            section_names_before,
+                            section_names_after,
+                        )
+                        # Print the reshuffle details as a single record
+                        log.info("\n".join(output_lines))
                 else:
                     log.info(
                         "'%s':'%s': no changes made to the order of %s name%s",
                         parent_section_name,
                         self.name,
-                        str(len(section_names_before)),
-                        "s" if len(section_names_before) != 1 else ""
+                        str(len(keys)),
+                        "s" if len(keys) != 1 else ""
                     )
             else:
                 log.debug("No H4 subsections in H3 section '%s'", self.name)
@@ -199,6 +332,11 @@ class Section:
                 parent_section_name,
             )
 
+        # Only h3 sections are sorted, and an h3 can never sit below another
+        # h3, so there is nothing left to do deeper in the tree
+        if self.depth >= 3:
+            return
+
         # Recursively call sort_subsections on each subsection
         for subsect in self.subsections:
             # Pass the current section name as the parent,
@@ -218,16 +356,65 @@ class Section:
         :return: string with markdown headers based on section depth
         and the section text.
         """
-        # Derived the markdown header based on depth
-        header_line = "#" * self.depth + " " + self.name + "\n"
-        # Maintain the original text intact
-        text_content = "".join(self.text)
-        # Generate the subsections content by applying the same formatting
-        subsections_content = "".join(
-            sub.to_markdownesque() for sub in self.subsections
-        )
-        # Combine header, text, and subsections without altering newlines
-        return header_line + text_content + subsections_content
+        buffer = io.StringIO()
+        self.write_markdownesque(buffer)
+        return buffer.getvalue()
+
+    def write_markdownesque(self, out):
+        """
+        Write the section and its subsections to a file-like object in the
+        same markdown-like structure as `to_markdownesque`. The tree is
+        walked iteratively, so no intermediate strings are built per level.
+
+        :param out: a writable text file-like object
+        """
+        stack = [self]
+        while stack:
+            section = stack.pop()
+            # Derived the markdown header based on depth
+            out.write("#" * section.depth)
+            out.write(" ")
+            out.write(section.name)
+            out.write("\n")
+            # Maintain the original text intact
+            out.write(section.text)
+            # Visit subsections next, in their original order
+            stack.extend(reversed(section.subsections))
+
+
+def _moved_positions(positions):
+    """
+    Find the names that changed place relative to the others.
+
+    The names that kept their relative order form the longest increasing
+    subsequence of their old positions, taken in their new order; every
+    other name was moved. This is the smallest set of names whose moves
+    explain the new order. It can be smaller than what `difflib.ndiff`
+    reported before, so counts in the reshuffle report may differ.
+
+    :param positions: the old position of each name, in the new order
+    :return: new positions of the moved names, in increasing order
+    """
+    tails = []  # Smallest old position ending a run of each length
+    tail_at = []  # Index into `positions` of each entry of `tails`
+    prev = [-1] * len(positions)  # Back-links to rebuild the longest run
+    for i, pos in enumerate(positions):
+        length = bisect_left(tails, pos)
+        if length:
+            prev[i] = tail_at[length - 1]
+        if length == len(tails):
+            tails.append(pos)
+            tail_at.append(i)
+        else:
+            tails[length] = pos
+            tail_at[length] = i
+
+    kept = set()
+    i = tail_at[-1] if tail_at else -1
+    while i != -1:
+        kept.add(i)
+        i = prev[i]
+    return [i for i in range(len(positions)) if i not in kept]
 
 
 def calculate_reshuffle_percentage(
@@ -248,13 +435,15 @@ def calculate_reshuffle_percentage(
     Returns:
         list: A list of strings containing the details of each reshuffled name.
     """
-    # Calculate the difference between the two lists of names
-    diff = difflib.ndiff(section_name_before, section_name_after)
+    # Queue each name's positions before sorting, so that repeated names
+    # are matched to their old positions in order
+    before_idx = {}
+    for i, name in enumerate(section_name_before):
+        before_idx.setdefault(name, deque()).append(i)
+    positions = [before_idx[name].popleft() for name in section_name_after]
 
-    # Find the names that have been moved (reshuffled)
-    moved = set(
-        line[2:] for line in diff if line.startswith("- ") or line.startswith("+ ")
-    )
+    # Find the new positions of the names that have been moved (reshuffled)
+    moved = _moved_positions(positions)
 
     # Count the number of reshuffled names
     reshuffled = len(moved)
@@ -271,9 +460,9 @@ def calculate_reshuffle_percentage(
     output_lines.append(shuffle_mess)
 
     # Generate details for each reshuffled name
-    for name in moved:
-        old_index = section_name_before.index(name)
-        new_index = section_name_after.index(name)
+    for new_index in moved:
+        name = section_name_after[new_index]
+        old_index = positions[new_index]
         if old_index == 0:
             moved_info = f"* {name} (was first, now after {section_name_after[new_index - 1]})"
         elif new_index == 0:
@@ -296,62 +485,110 @@ def parse_file(input_path, debug=False):
     """
     with open(input_path, "r", encoding="utf-8") as file:
         # Original carriage returns are preserved
-        lines = file.readlines()
+        content = file.read()
 
     root_sections = []  # To hold top-level sections
     section_stack = []  # To keep track of the current section hierarchy
+    text_start = 0  # Start of the text run following the last header
+
+    for match in _HEADER_RE.finditer(content):
+        # Text lines are assigned to the most recently active section
+        if section_stack:
+            section_stack[-1].text = content[text_start:match.start()]
+        text_start = match.end() + 1  # Skip the header's newline
+
+        header_level = match.end(1) - match.start(1)
+        # Interned, so names shared across sections (and the
+        # sections-to-sort lookups) compare by identity first
+        section_name = sys.intern(match.group(2))
+
+        # Instantiate a new section
+        new_section = Section(section_name, header_level)
+
+        # Pop sections from the stack until reaching the proper
+        # parent level
+        while section_stack and section_stack[-1].depth >= header_level:
+            section_stack.pop()
+
+        # Add new_section as a subsection or as a root section
+        if section_stack:
+            section_stack[-1].subsections.append(new_section)
+        else:
+            root_sections.append(new_section)
 
-    for line in lines:
-        if line.startswith("#"):
-            header_level = len(line) - len(line.lstrip("#"))
-            section_name = line[header_level + 1:].strip()
+        # New section is now the latest active section
+        section_stack.append(new_section)
+        log.debug(
+            "Added section: %s at depth %s", new_section.name, new_section.depth
+        )
 
-            # Instantiate a new section
-            new_section = Section(section_name, header_level)
+    # Trailing text belongs to the last active section
+    if section_stack:
+        section_stack[-1].text = content[text_start:]
 
-            # Pop sections from the stack until reaching the proper
-            # parent level
-            while section_stack and section_stack[-1].depth >= header_level:
-                section_stack.pop()
+    # Debug option to log the original content of the file, reusing the
+    # content already read rather than opening the file again
+    if debug:
+        log.debug(
+            "\n--- Original Content of %s ---\n"
+            "%s\n--- End of Original Content ---\n",
+            input_path,
+            content,
+        )
 
-            # Add new_section as a subsection or as a root section
-            if section_stack:
-                section_stack[-1].subsections.append(new_section)
-            else:
-                root_sections.append(new_section)
+    return root_sections
 
-            # New section is now the latest active section
-            section_stack.append(new_section)
-            log.debug(
-                "Added section: %s at depth %s", new_section.name, new_section.depth
-            )
 
-        else:
-            # Text lines are assigned to the most recently active section
-            if section_stack:
-                section_stack[-1].text.append(line)
+def tidy_file(input_path, output_path, sections_to_sort, debug=False):
+    """
+    Parses an input file, sorts its applicable sections and writes the
+    result to the output file.
 
-    # Debug option to log the original content of the file
+    :param input_path: Path to the input file.
+    :param output_path: Path to the output file.
+    :param sections_to_sort: Names of the h2 sections to sort.
+    :param debug: Enable debug mode for additional output.
+    """
+    # Worker processes start with the module's default log level
     if debug:
-        with open(input_path, "r", encoding="utf-8") as debug_file:
-            content = debug_file.read()
-            log.debug(
-                "\n--- Original Content of %s ---\n"
-                "%s\n--- End of Original Content ---\n",
-                input_path,
-                content,
-            )
+        log.setLevel(logging.DEBUG)
 
-    return root_sections
+    # Generate nested Section objects from input file
+    sections = parse_file(input_path, debug=debug)
+
+    # Sort applicable subsections. Only h2 sections chosen for sorting can
+    # hold h3 sections that need it, so the others are skipped outright.
+    for section in sections:
+        if section.depth == 1:
+            for subsection in section.subsections:
+                if subsection.depth == 2 and subsection.name in sections_to_sort:
+                    log.debug(
+                        "Outer: Processing subsections in H2 section '%s'...",
+                        subsection.name,
+                    )
+                    subsection.sort_subsections(
+                        subsection.name, None, sections_to_sort
+                    )
+
+    # Write the structured contents to the output markdown file
+    with open(output_path, "w", encoding="utf-8") as out_file:
+        for section in sections:
+            section.write_markdownesque(out_file)
 
 
 if __name__ == "__main__":
 
     # Prepare argument parser
     parser = argparse.ArgumentParser(description="Sorts entries in a markdown file.")
-    parser.add_argument("--input", "-i", required=True, help="Input markdown file path")
     parser.add_argument(
-        "--output", "-o", required=True, help="Output markdown file path"
+        "--input", "-i", required=True, nargs="+", help="Input markdown file path(s)"
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        required=True,
+        nargs="+",
+        help="Output markdown file path(s), one per input",
     )
     parser.add_argument(
         "--sections",
@@ -364,34 +601,31 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     # Fetch arguments
-    input_file = args.input
-    output_file = args.output
-    sections_to_sort = args.sections
+    input_files = args.input
+    output_files = args.output
+    # A frozenset makes the per-section membership check a hash lookup
+    sections_to_sort = frozenset(map(sys.intern, args.sections))
     debug_mode = args.debug
 
+    if len(input_files) != len(output_files):
+        parser.error("--input and --output need the same number of paths")
+
     if debug_mode:
         log.setLevel(logging.DEBUG)
         log.debug("Debug mode enabled")
 
-    # Generate nested Section objects from input file
-    sections = parse_file(input_file, debug=debug_mode)
-
-    for section in sections:
-        # Sort applicable subsections
-        for section in sections:
-            if section.depth == 1:
-                for subsection in section.subsections:
-                    if subsection.depth == 2:
-                        log.debug(
-                            "Outer: Processing subsections in H2 section '%s'..."
-                            % subsection.name
-                        )
-                        subsection.sort_subsections(
-                            subsection.name, None, sections_to_sort
-                        )
-
-    # Write the structured contents to the output markdown file
-    with open(output_file, "w", encoding="utf-8") as out_file:
-        for section in sections:
-            formatted_section = section.to_markdownesque()
-            out_file.write(formatted_section)
+    if len(input_files) == 1:
+        tidy_file(input_files[0], output_files[0], sections_to_sort, debug_mode)
+    else:
+        # Each file is independent and CPU-bound, so spread them across
+        # processes rather than threads
+        with ProcessPoolExecutor() as executor:
+            list(
+                executor.map(
+                    tidy_file,
+                    input_files,
+                    output_files,
+                    repeat(sections_to_sort),
+                    repeat(debug_mode),
+                )
+            )